@@ -1,4 +1,4 @@
-from flask import Flask, render_template, request, jsonify, send_from_directory
+from flask import Flask, render_template, request, jsonify, send_from_directory, url_for
 import os
 from werkzeug.utils import secure_filename
 import json
@@ -7,6 +7,8 @@ from datetime import datetime
 from config import Config
 from models.gemini_service import GeminiService
 from models.youtube_service import YouTubeService
+from models.session_store import SessionStore
+from models.asset_service import AssetService
 
 # Initialize Flask app
 app = Flask(__name__)
@@ -15,6 +17,12 @@ app.config.from_object(Config)
 # Ensure upload folder exists
 os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
 
+# Fingerprinted static assets (built by build_assets.py)
+asset_service = AssetService()
+
+# Follow-up conversation sessions
+session_store = SessionStore()
+
 # Initialize services
 try:
     gemini_service = GeminiService()
@@ -25,6 +33,18 @@ except Exception as e:
     services_initialized = False
 
 
+@app.context_processor
+def inject_asset_url():
+    """Expose asset_url() to templates for fingerprinted static assets"""
+    def asset_url(filename):
+        hashed_path = asset_service.hashed_path(filename)
+        if hashed_path:
+            return url_for('serve_asset', filename=hashed_path)
+        # Assets not built (e.g. local development) - serve the source file
+        return url_for('static', filename=filename)
+    return {'asset_url': asset_url}
+
+
 @app.route('/')
 def index():
     """Render main page"""
@@ -68,9 +88,18 @@ def analyze():
                 search_keywords = analysis_result.get('search_keywords', [query])
                 youtube_result = youtube_service.search_multiple_queries(search_keywords)
                 
+                # Start a follow-up session seeded with this diagnosis
+                session_id = session_store.create(
+                    gemini_service.build_session_history(
+                        f"User Question: {query}",
+                        analysis_result['analysis']
+                    )
+                )
+                
                 return jsonify({
                     'success': True,
                     'type': 'text',
+                    'session_id': session_id,
                     'analysis': analysis_result['analysis'],
                     'videos': youtube_result.get('videos', []),
                     'timestamp': datetime.now().isoformat()
@@ -113,9 +142,18 @@ def analyze():
                 # Search YouTube
                 youtube_result = youtube_service.search_multiple_queries(search_queries)
                 
+                # Start a follow-up session seeded with this diagnosis
+                session_id = session_store.create(
+                    gemini_service.build_session_history(
+                        "Analyze this uploaded image of an Alto car component.",
+                        analysis_text
+                    )
+                )
+                
                 return jsonify({
                     'success': True,
                     'type': 'image',
+                    'session_id': session_id,
                     'analysis': analysis_result['analysis'],
                     'component_type': analysis_result.get('component_type', 'unknown'),
                     'videos': youtube_result.get('videos', []),
@@ -158,6 +196,54 @@ def analyze():
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
+@app.route('/followup', methods=['POST'])
+def followup():
+    """
+    Follow-up question endpoint - continues a diagnosis session from /analyze
+    """
+    if not services_initialized:
+        return jsonify({
+            'success': False,
+            'error': 'Services not properly configured. Please check API keys.'
+        }), 500
+    
+    try:
+        session_id = request.form.get('session_id', '')
+        query = request.form.get('query', '').strip()
+        if not session_id or not query:
+            return jsonify({'success': False, 'error': 'Session ID and query are required'}), 400
+        
+        history = session_store.get(session_id)
+        if history is None:
+            return jsonify({
+                'success': False,
+                'error': 'Session expired. Please start a new analysis.'
+            }), 404
+        
+        followup_result = gemini_service.follow_up(history, query)
+        
+        if followup_result['success']:
+            session_store.update(session_id, followup_result['history'])
+            
+            youtube_result = youtube_service.search_multiple_queries(
+                followup_result.get('search_keywords', [query])
+            )
+            
+            return jsonify({
+                'success': True,
+                'type': 'followup',
+                'session_id': session_id,
+                'analysis': followup_result['analysis'],
+                'videos': youtube_result.get('videos', []),
+                'timestamp': datetime.now().isoformat()
+            })
+        else:
+            return jsonify(followup_result), 500
+    
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+
 @app.route('/knowledge-base')
 def knowledge_base():
     """Get Alto car knowledge base"""
@@ -191,6 +277,21 @@ def uploaded_file(filename):
     return send_from_directory(app.config['UPLOAD_FOLDER'], filename)
 
 
+@app.route('/assets/<path:filename>')
+def serve_asset(filename):
+    """Serve fingerprinted assets with immutable caching and precompression"""
+    accepted_encodings = {value for value, quality in request.accept_encodings if quality > 0}
+    variant, encoding, mimetype = asset_service.resolve(filename, accepted_encodings)
+    
+    response = send_from_directory(asset_service.build_folder, variant,
+                                   mimetype=mimetype, max_age=Config.ASSET_MAX_AGE)
+    if encoding:
+        response.headers['Content-Encoding'] = encoding
+    response.headers['Vary'] = 'Accept-Encoding'
+    response.headers['Cache-Control'] = f'public, max-age={Config.ASSET_MAX_AGE}, immutable'
+    return response
+
+
 @app.route('/health')
 def health():
     """Health check endpoint"""
@@ -5,3 +5,6 @@ set -o errexit
 # Install Python dependencies
 pip install --upgrade pip
 pip install -r requirements.txt
+
+# Minify, fingerprint and precompress static assets
+python build_assets.py
@@ -0,0 +1,109 @@
+"""
+Build script for static assets
+
+Minifies the CSS/JS files listed in Config.ASSET_FILES, writes content-hashed
+copies (plus .gz and .br variants) to Config.ASSET_BUILD_FOLDER and records
+the original -> hashed filename mapping in Config.ASSET_MANIFEST.
+
+Usage: python build_assets.py
+"""
+import gzip
+import hashlib
+import json
+import os
+import re
+import shutil
+
+from config import Config
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+def minify_css(source):
+    """Strip comments and redundant whitespace from CSS"""
+    source = re.sub(r'/\*.*?\*/', '', source, flags=re.DOTALL)
+    source = re.sub(r'\s+', ' ', source)
+    source = re.sub(r'\s*([{};,])\s*', r'\1', source)
+    source = re.sub(r':\s+', ':', source)
+    return source.replace(';}', '}').strip()
+
+
+def minify_js(source):
+    """Conservatively minify JS: drop comment-only lines, indentation and blank lines"""
+    lines = []
+    for line in source.splitlines():
+        stripped = line.strip()
+        if not stripped or stripped.startswith('//'):
+            continue
+        lines.append(stripped)
+    return '\n'.join(lines) + '\n'
+
+
+MINIFIERS = {
+    '.css': minify_css,
+    '.js': minify_js
+}
+
+
+def build_asset(relative_path):
+    """
+    Minify, fingerprint and precompress a single asset
+
+    Args:
+        relative_path: Path relative to the static folder (e.g. 'css/style.css')
+
+    Returns:
+        str: Hashed path relative to the build folder
+    """
+    source_path = os.path.join(Config.ASSET_SOURCE_FOLDER, relative_path)
+    with open(source_path, 'r', encoding='utf-8') as f:
+        source = f.read()
+
+    base, ext = os.path.splitext(relative_path)
+    minifier = MINIFIERS.get(ext)
+    content = (minifier(source) if minifier else source).encode('utf-8')
+
+    digest = hashlib.sha256(content).hexdigest()[:12]
+    hashed_path = f"{base}.{digest}{ext}"
+    output_path = os.path.join(Config.ASSET_BUILD_FOLDER, hashed_path)
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+
+    with open(output_path, 'wb') as f:
+        f.write(content)
+    # mtime=0 keeps the gzip output byte-identical across builds
+    with open(output_path + '.gz', 'wb') as f:
+        f.write(gzip.compress(content, compresslevel=9, mtime=0))
+    if brotli is not None:
+        with open(output_path + '.br', 'wb') as f:
+            f.write(brotli.compress(content, quality=11))
+
+    return hashed_path
+
+
+def build_all():
+    """Rebuild every configured asset and write the manifest"""
+    if os.path.exists(Config.ASSET_BUILD_FOLDER):
+        shutil.rmtree(Config.ASSET_BUILD_FOLDER)
+    os.makedirs(Config.ASSET_BUILD_FOLDER)
+
+    manifest = {}
+    for relative_path in Config.ASSET_FILES:
+        manifest[relative_path] = build_asset(relative_path)
+        print(f"  {relative_path} -> {manifest[relative_path]}")
+
+    with open(Config.ASSET_MANIFEST, 'w') as f:
+        json.dump(manifest, f, indent=2)
+
+    if brotli is None:
+        print("Warning: brotli not installed, skipped .br variants")
+
+    return manifest
+
+
+if __name__ == '__main__':
+    print("Building static assets...")
+    build_all()
+    print(f"Manifest written to {Config.ASSET_MANIFEST}")
@@ -22,6 +22,13 @@ class Config:
     ALLOWED_IMAGE_EXTENSIONS = {'png', 'jpg', 'jpeg', 'gif'}
     ALLOWED_VIDEO_EXTENSIONS = {'mp4', 'avi', 'mov'}
     
+    # Static Asset Pipeline Configuration
+    ASSET_SOURCE_FOLDER = 'static'
+    ASSET_BUILD_FOLDER = 'static/dist'
+    ASSET_MANIFEST = 'static/dist/manifest.json'
+    ASSET_FILES = ['css/style.css', 'js/main.js', 'js/analysis.js']
+    ASSET_MAX_AGE = 365 * 24 * 60 * 60  # 1 year, safe because URLs are content-hashed
+    
     # Application Info
     APP_NAME = os.getenv('APP_NAME', 'Alto Car Digital Manual')
     APP_VERSION = os.getenv('APP_VERSION', '1.0.0')
@@ -31,6 +38,11 @@ class Config:
     GEMINI_TEMPERATURE = 0.7
     GEMINI_MAX_TOKENS = 2048
     
+    # Follow-up Session Configuration
+    SESSION_MAX_ENTRIES = int(os.getenv('SESSION_MAX_ENTRIES', 500))
+    SESSION_IDLE_TIMEOUT = int(os.getenv('SESSION_IDLE_TIMEOUT', 30 * 60))  # seconds
+    CHAT_HISTORY_TOKEN_BUDGET = int(os.getenv('CHAT_HISTORY_TOKEN_BUDGET', 4000))
+    
     # YouTube Search Configuration
     YOUTUBE_MAX_RESULTS = 5
     
@@ -0,0 +1,52 @@
+import json
+import mimetypes
+import os
+from config import Config
+
+
+class AssetService:
+    """Service class for resolving fingerprinted, precompressed static assets"""
+
+    # Preferred order when the client accepts several encodings
+    ENCODINGS = [('br', '.br'), ('gzip', '.gz')]
+
+    def __init__(self):
+        """Load the asset manifest produced by build_assets.py"""
+        self.build_folder = os.path.abspath(Config.ASSET_BUILD_FOLDER)
+        self.manifest = {}
+
+        if os.path.exists(Config.ASSET_MANIFEST):
+            with open(Config.ASSET_MANIFEST, 'r') as f:
+                self.manifest = json.load(f)
+
+    def hashed_path(self, filename):
+        """
+        Get the fingerprinted path for a static file
+
+        Args:
+            filename: Path relative to the static folder (e.g. 'css/style.css')
+
+        Returns:
+            str: Hashed path relative to the build folder, or None if not built
+        """
+        return self.manifest.get(filename)
+
+    def resolve(self, hashed_filename, accepted_encodings):
+        """
+        Pick the best precompressed variant of a built asset
+
+        Args:
+            hashed_filename: Path relative to the build folder
+            accepted_encodings: Encodings the client accepts (e.g. {'gzip', 'br'})
+
+        Returns:
+            tuple: (file to send, Content-Encoding or None, mimetype)
+        """
+        mimetype = mimetypes.guess_type(hashed_filename)[0] or 'application/octet-stream'
+
+        for encoding, suffix in self.ENCODINGS:
+            variant = hashed_filename + suffix
+            if encoding in accepted_encodings and os.path.isfile(os.path.join(self.build_folder, variant)):
+                return variant, encoding, mimetype
+
+        return hashed_filename, None, mimetype
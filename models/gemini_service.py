@@ -15,6 +15,17 @@ class GeminiService:
         genai.configure(api_key=Config.GEMINI_API_KEY)
         self.model = genai.GenerativeModel(Config.GEMINI_MODEL)
         
+        # Follow-up chats carry only a short persona; the knowledge base was
+        # already applied in the initial analysis kept in the chat history
+        self.chat_model = genai.GenerativeModel(
+            Config.GEMINI_MODEL,
+            system_instruction=(
+                "You are an expert automotive technician specializing in Maruti Suzuki Alto cars. "
+                "Answer follow-up questions using the earlier diagnosis in this conversation. "
+                "Be practical and concise, and include 3-5 YouTube search keywords."
+            )
+        )
+        
         # Load Alto knowledge base
         knowledge_base_path = 'data/alto_knowledge_base.json'
         if os.path.exists(knowledge_base_path):
@@ -168,6 +179,82 @@ Be specific to Maruti Alto cars when possible."""
                 'analysis': f"Error analyzing video: {str(e)}"
             }
     
+    def build_session_history(self, request_summary, analysis):
+        """
+        Build the initial chat history for a follow-up session
+        
+        Args:
+            request_summary: Short text describing the original request
+            analysis: Analysis text returned for that request
+            
+        Returns:
+            list: Chat history seeded with the original diagnosis
+        """
+        history = [
+            {'role': 'user', 'parts': [request_summary]},
+            {'role': 'model', 'parts': [analysis]}
+        ]
+        return self._trim_history(history)
+    
+    def follow_up(self, history, query):
+        """
+        Answer a follow-up question within an existing diagnosis session
+        
+        Args:
+            history: Chat history from the session store
+            query: User's follow-up question
+            
+        Returns:
+            dict: Answer, search keywords and the updated (trimmed) history
+        """
+        try:
+            chat = self.chat_model.start_chat(history=history)
+            response = chat.send_message(query)
+            
+            updated_history = history + [
+                {'role': 'user', 'parts': [query]},
+                {'role': 'model', 'parts': [response.text]}
+            ]
+            
+            return {
+                'success': True,
+                'analysis': response.text,
+                'search_keywords': self._extract_search_keywords(response.text),
+                'history': self._trim_history(updated_history)
+            }
+            
+        except Exception as e:
+            return {
+                'success': False,
+                'error': str(e),
+                'analysis': f"Error processing follow-up: {str(e)}"
+            }
+    
+    def _trim_history(self, history):
+        """
+        Keep chat history within the configured token budget
+        
+        The first exchange (the original diagnosis) is always kept; the oldest
+        follow-up exchanges after it are dropped first. If the diagnosis alone
+        exceeds the budget its text is truncated.
+        """
+        budget = Config.CHAT_HISTORY_TOKEN_BUDGET
+        anchor, rest = history[:2], history[2:]
+        
+        while rest and self._estimate_tokens(anchor + rest) > budget:
+            rest = rest[2:]
+        
+        if self._estimate_tokens(anchor) > budget:
+            analysis = anchor[1]['parts'][0]
+            max_chars = max(budget * 4 - len(anchor[0]['parts'][0]), 0)
+            anchor = [anchor[0], {'role': 'model', 'parts': [analysis[:max_chars]]}]
+        
+        return anchor + rest
+    
+    def _estimate_tokens(self, history):
+        """Rough token estimate (~4 characters per token) without an API call"""
+        return sum(len(part) for turn in history for part in turn['parts']) // 4
+    
     def _extract_component_type(self, text):
         """Extract component type from analysis text"""
         text_lower = text.lower()
@@ -0,0 +1,92 @@
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from config import Config
+
+
+class SessionStore:
+    """In-memory store for diagnosis chat sessions with LRU and idle eviction"""
+
+    def __init__(self, max_sessions=None, idle_timeout=None):
+        """
+        Initialize the session store
+
+        Args:
+            max_sessions: Maximum number of sessions kept in memory
+            idle_timeout: Seconds of inactivity after which a session is dropped
+        """
+        self.max_sessions = max_sessions or Config.SESSION_MAX_ENTRIES
+        self.idle_timeout = idle_timeout or Config.SESSION_IDLE_TIMEOUT
+        self._sessions = OrderedDict()
+        self._lock = threading.Lock()
+
+    def create(self, history):
+        """
+        Store a new session
+
+        Args:
+            history: List of chat turns ({'role': ..., 'parts': [...]})
+
+        Returns:
+            str: Newly generated session id
+        """
+        session_id = uuid.uuid4().hex
+        with self._lock:
+            self._evict_expired()
+            self._sessions[session_id] = {
+                'history': history,
+                'last_access': time.monotonic()
+            }
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+        return session_id
+
+    def get(self, session_id):
+        """
+        Get the chat history for a session and mark it as recently used
+
+        Args:
+            session_id: Session id returned by create()
+
+        Returns:
+            list: Chat history, or None if the session is unknown or expired
+        """
+        with self._lock:
+            self._evict_expired()
+            session = self._sessions.get(session_id)
+            if session is None:
+                return None
+            session['last_access'] = time.monotonic()
+            self._sessions.move_to_end(session_id)
+            return list(session['history'])
+
+    def update(self, session_id, history):
+        """
+        Replace the chat history of an existing session
+
+        Returns:
+            bool: False if the session no longer exists
+        """
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session is None:
+                return False
+            session['history'] = history
+            session['last_access'] = time.monotonic()
+            self._sessions.move_to_end(session_id)
+            return True
+
+    def __len__(self):
+        with self._lock:
+            return len(self._sessions)
+
+    def _evict_expired(self):
+        """Drop sessions idle for longer than the timeout (lock must be held)"""
+        cutoff = time.monotonic() - self.idle_timeout
+        # Sessions are ordered by last access, so stop at the first live one
+        while self._sessions:
+            session_id, session = next(iter(self._sessions.items()))
+            if session['last_access'] >= cutoff:
+                break
+            del self._sessions[session_id]
@@ -199,6 +199,48 @@ function analyzeText() {
     });
 }
 
+// Follow-up question handling
+function askFollowUp() {
+    const query = document.getElementById('followup-query').value.trim();
+    
+    if (!currentSessionId) {
+        showError('Please run an analysis before asking a follow-up question');
+        return;
+    }
+    
+    if (!query) {
+        showError('Please enter a follow-up question');
+        return;
+    }
+    
+    showLoading();
+    
+    const formData = new FormData();
+    formData.append('session_id', currentSessionId);
+    formData.append('query', query);
+    
+    fetch('/followup', {
+        method: 'POST',
+        body: formData
+    })
+    .then(response => response.json())
+    .then(data => {
+        hideLoading();
+        
+        if (data.success) {
+            document.getElementById('followup-query').value = '';
+            displayResults(data);
+        } else {
+            showError(formatError(data));
+        }
+    })
+    .catch(error => {
+        hideLoading();
+        showError('Network error. Please check your connection and try again.');
+        console.error('Error:', error);
+    });
+}
+
 // Drag and drop support for image upload
 const imageUploadArea = document.getElementById('image-upload-area');
 if (imageUploadArea) {
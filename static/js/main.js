@@ -1,5 +1,8 @@
 // Main JavaScript for Alto Car Manual
 
+// Follow-up session id returned by /analyze
+let currentSessionId = null;
+
 // Tab switching functionality
 function switchTab(tabName) {
     // Hide all tab contents
@@ -81,6 +84,13 @@ function displayResults(data) {
         videosContainer.innerHTML = '<p style="color: #666;">No related videos found. Try a different query.</p>';
     }
     
+    // Offer follow-up questions when the server opened a session
+    const followupCard = document.getElementById('followup-card');
+    if (followupCard) {
+        currentSessionId = data.session_id || null;
+        followupCard.style.display = currentSessionId ? 'block' : 'none';
+    }
+    
     showResults();
 }
 